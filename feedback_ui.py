@@ -2,25 +2,42 @@
 # Developed by Fábio Ferreira (https://x.com/fabiomlferreira)
 # Inspired by/related to dotcursorrules.com (https://dotcursorrules.com/)
 import os
+import io
 import sys
 import json
+import atexit
+import codecs
 import psutil
 import argparse
 import subprocess
 import threading
 import hashlib
+import signal
+import functools
 
-from typing import Optional, TypedDict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TypedDict, List, Set
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QCheckBox, QTextEdit, QGroupBox,
-    QListWidget, QListWidgetItem, QSplitter, QScrollArea, QFrame,
-    QSizePolicy
+    QLabel, QLineEdit, QPushButton, QCheckBox, QTextEdit, QPlainTextEdit, QGroupBox,
+    QListWidget, QListWidgetItem, QSplitter, QFrame,
+    QSizePolicy, QListView, QAbstractItemView, QStyledItemDelegate, QStyle,
+    QStyleOptionButton
+)
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QObject, QTimer, QThread, QSettings, QEvent, QRect, QSize,
+    QAbstractListModel, QModelIndex, QSortFilterProxyModel
 )
-from PySide6.QtCore import Qt, Signal, QObject, QTimer, QSettings
 from PySide6.QtGui import QShortcut, QKeySequence
-from PySide6.QtGui import QTextCursor, QIcon, QKeyEvent, QFont, QFontDatabase, QPalette, QColor
+from PySide6.QtGui import QTextCursor, QIcon, QKeyEvent, QFont, QFontDatabase, QFontMetrics, QPalette, QColor
+
+_IS_WIN = sys.platform == "win32"
+_SLASH_TRANS = str.maketrans({"/": "\\"})
+
+# Limits on selected file content included in the feedback (in characters)
+MAX_PER_FILE = 256 * 1024
+MAX_TOTAL = 4 * 1024 * 1024
 
 class FeedbackResult(TypedDict):
     command_logs: str
@@ -34,7 +51,7 @@ class FeedbackConfig(TypedDict):
 
 def set_dark_title_bar(widget: QWidget, dark_title_bar: bool) -> None:
     # Ensure we're on Windows
-    if sys.platform != "win32":
+    if not _IS_WIN:
         return
 
     from ctypes import windll, c_uint32, byref
@@ -59,63 +76,164 @@ def set_dark_title_bar(widget: QWidget, dark_title_bar: bool) -> None:
     c_dark_title_bar = c_uint32(dark_title_bar)  # Convert to C-compatible uint32
     dwmapi.DwmSetWindowAttribute(hwnd, attribute, byref(c_dark_title_bar), 4)
 
-    # HACK: Create a 1x1 pixel frameless window to force redraw
-    temp_widget = QWidget(None, Qt.FramelessWindowHint)
-    temp_widget.resize(1, 1)
-    temp_widget.move(widget.pos())
-    temp_widget.show()
-    temp_widget.deleteLater()  # Safe deletion in Qt event loop
+    # Force the non-client area (title bar) to repaint without moving, resizing or activating
+    SWP_NOSIZE = 0x0001
+    SWP_NOMOVE = 0x0002
+    SWP_NOZORDER = 0x0004
+    SWP_NOACTIVATE = 0x0010
+    SWP_FRAMECHANGED = 0x0020
+    windll.user32.SetWindowPos(
+        hwnd, 0, 0, 0, 0, 0,
+        SWP_NOMOVE | SWP_NOSIZE | SWP_NOZORDER | SWP_NOACTIVATE | SWP_FRAMECHANGED
+    )
+
+_DARK_COLORS = (
+    (QPalette.Window, QColor(53, 53, 53)),
+    (QPalette.WindowText, Qt.white),
+    (QPalette.Disabled, QPalette.WindowText, QColor(127, 127, 127)),
+    (QPalette.Base, QColor(42, 42, 42)),
+    (QPalette.AlternateBase, QColor(66, 66, 66)),
+    (QPalette.ToolTipBase, QColor(53, 53, 53)),
+    (QPalette.ToolTipText, Qt.white),
+    (QPalette.Text, Qt.white),
+    (QPalette.Disabled, QPalette.Text, QColor(127, 127, 127)),
+    (QPalette.Dark, QColor(35, 35, 35)),
+    (QPalette.Shadow, QColor(20, 20, 20)),
+    (QPalette.Button, QColor(53, 53, 53)),
+    (QPalette.ButtonText, Qt.white),
+    (QPalette.Disabled, QPalette.ButtonText, QColor(127, 127, 127)),
+    (QPalette.BrightText, Qt.red),
+    (QPalette.Link, QColor(42, 130, 218)),
+    (QPalette.Highlight, QColor(42, 130, 218)),
+    (QPalette.Disabled, QPalette.Highlight, QColor(80, 80, 80)),
+    (QPalette.HighlightedText, Qt.white),
+    (QPalette.Disabled, QPalette.HighlightedText, QColor(127, 127, 127)),
+    (QPalette.PlaceholderText, QColor(127, 127, 127))
+)
+
+_DARK_PALETTE = QPalette()
+for _color_args in _DARK_COLORS:
+    _DARK_PALETTE.setColor(*_color_args)
 
 def get_dark_mode_palette(app: QApplication):
-    darkPalette = app.palette()
-    darkPalette.setColor(QPalette.Window, QColor(53, 53, 53))
-    darkPalette.setColor(QPalette.WindowText, Qt.white)
-    darkPalette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(127, 127, 127))
-    darkPalette.setColor(QPalette.Base, QColor(42, 42, 42))
-    darkPalette.setColor(QPalette.AlternateBase, QColor(66, 66, 66))
-    darkPalette.setColor(QPalette.ToolTipBase, QColor(53, 53, 53))
-    darkPalette.setColor(QPalette.ToolTipText, Qt.white)
-    darkPalette.setColor(QPalette.Text, Qt.white)
-    darkPalette.setColor(QPalette.Disabled, QPalette.Text, QColor(127, 127, 127))
-    darkPalette.setColor(QPalette.Dark, QColor(35, 35, 35))
-    darkPalette.setColor(QPalette.Shadow, QColor(20, 20, 20))
-    darkPalette.setColor(QPalette.Button, QColor(53, 53, 53))
-    darkPalette.setColor(QPalette.ButtonText, Qt.white)
-    darkPalette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(127, 127, 127))
-    darkPalette.setColor(QPalette.BrightText, Qt.red)
-    darkPalette.setColor(QPalette.Link, QColor(42, 130, 218))
-    darkPalette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-    darkPalette.setColor(QPalette.Disabled, QPalette.Highlight, QColor(80, 80, 80))
-    darkPalette.setColor(QPalette.HighlightedText, Qt.white)
-    darkPalette.setColor(QPalette.Disabled, QPalette.HighlightedText, QColor(127, 127, 127))
-    darkPalette.setColor(QPalette.PlaceholderText, QColor(127, 127, 127))
-    return darkPalette
-
-def kill_tree(process: subprocess.Popen):
-    killed: list[psutil.Process] = []
-    parent = psutil.Process(process.pid)
-    for proc in parent.children(recursive=True):
-        try:
-            proc.kill()
-            killed.append(proc)
-        except psutil.Error:
-            pass
+    # Roles not in _DARK_COLORS fall back to the application's palette, as before
+    return _DARK_PALETTE.resolve(app.palette())
+
+# Application-wide stylesheet: parsed once by Qt instead of once per widget.
+# Widgets opt in through their objectName.
+APP_QSS = """
+QListView#fileList {
+    border: 1px solid #555555;
+    border-radius: 4px;
+    background-color: #2b2b2b;
+}
+QLabel#fileCountLabel {
+    color: #cccccc;
+    font-size: 10pt;
+}
+QLabel#ruleLabel {
+    color: #ffffff;
+}
+QLabel#contactLabel {
+    color: #cccccc; /* Light gray for dark theme */
+}
+QPushButton#quickAction {
+    font-size: 10pt;
+    padding: 4px 8px;
+}
+QPushButton#smallButton {
+    font-size: 9pt;
+    padding: 2px 6px;
+}
+"""
+
+def _safe_kill(proc: psutil.Process) -> None:
     try:
-        parent.kill()
+        proc.kill()
     except psutil.Error:
         pass
-    killed.append(parent)
 
-    # Terminate any remaining processes
-    for proc in killed:
+def _safe_terminate(proc: psutil.Process) -> None:
+    try:
+        if proc.is_running():
+            proc.terminate()
+    except psutil.Error:
+        pass
+
+@functools.lru_cache(maxsize=None)
+def _job_api():
+    """kernel32 with the Job Object functions typed"""
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateJobObjectW.argtypes = [wintypes.LPVOID, wintypes.LPCWSTR]
+    kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+    kernel32.AssignProcessToJobObject.restype = wintypes.BOOL
+    kernel32.TerminateJobObject.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    kernel32.TerminateJobObject.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    return kernel32
+
+def create_kill_job(process: subprocess.Popen):
+    """Put process in a Windows Job Object so its whole tree can be killed at once.
+
+    Returns the job handle, or None on other platforms or if the job could not be set up.
+    """
+    if not _IS_WIN:
+        return None
+
+    # No KILL_ON_JOB_CLOSE limit: like the POSIX process group, the job only kills on an explicit
+    # kill_tree, so background children of a command that exits normally keep running
+    kernel32 = _job_api()
+    job = kernel32.CreateJobObjectW(None, None)
+    if not job:
+        return None
+
+    if not kernel32.AssignProcessToJobObject(job, int(process._handle)):
+        kernel32.CloseHandle(job)
+        return None
+    return job
+
+def close_kill_job(job) -> None:
+    """Release a job from create_kill_job without killing what is still running in it"""
+    _job_api().CloseHandle(job)
+
+def kill_tree(process: subprocess.Popen, job=None):
+    # Windows: one TerminateJobObject call kills every process in the job,
+    # including children spawned after the job was created
+    if job is not None:
+        _job_api().TerminateJobObject(job, 1)
+        close_kill_job(job)
+        return
+
+    # POSIX: the command runs in its own session, so its process group is the whole tree
+    if not _IS_WIN:
         try:
-            if proc.is_running():
-                proc.terminate()
-        except psutil.Error:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except ProcessLookupError:
+            return
+        except OSError:
             pass
 
+    parent = psutil.Process(process.pid)
+    try:
+        procs = parent.children(recursive=True) + [parent]
+    except psutil.Error:
+        procs = [parent]
+
+    # kill/terminate are blocking syscalls that release the GIL, so a large
+    # process tree is torn down in parallel rather than one process at a time
+    with ThreadPoolExecutor(max_workers=min(32, len(procs))) as executor:
+        list(executor.map(_safe_kill, procs))
+        # Terminate any remaining processes
+        list(executor.map(_safe_terminate, procs))
+
 def get_user_environment() -> dict[str, str]:
-    if sys.platform != "win32":
+    if not _IS_WIN:
         return os.environ.copy()
 
     import ctypes
@@ -162,31 +280,21 @@ def get_user_environment() -> dict[str, str]:
             raise RuntimeError("Failed to create environment block")
 
         try:
-            # Convert environment block to list of strings
+            # Convert environment block to a dict, one NUL-terminated string at a time.
+            # wstring_at does the scan and copy in C; the block ends with an empty string.
             result = {}
-            env_ptr = ctypes.cast(environment, ctypes.POINTER(ctypes.c_wchar))
-            offset = 0
-
+            address = environment.value
             while True:
-                # Get string at current offset
-                current_string = ""
-                while env_ptr[offset] != "\0":
-                    current_string += env_ptr[offset]
-                    offset += 1
-
-                # Skip null terminator
-                offset += 1
-
-                # Break if we hit double null terminator
+                current_string = ctypes.wstring_at(address)
                 if not current_string:
                     break
 
-                equal_index = current_string.index("=")
-                if equal_index == -1:
-                    continue
+                # Advance in UTF-16 code units, which may differ from len() for surrogate pairs
+                address += len(current_string.encode("utf-16-le", "surrogatepass")) + ctypes.sizeof(ctypes.c_wchar)
 
-                key = current_string[:equal_index]
-                value = current_string[equal_index + 1:]
+                key, separator, value = current_string.partition("=")
+                if not separator:
+                    continue
                 result[key] = value
 
             return result
@@ -198,201 +306,440 @@ def get_user_environment() -> dict[str, str]:
         CloseHandle(token)
 
 class FeedbackTextEdit(QTextEdit):
-    def __init__(self, parent=None):
+    def __init__(self, feedback_ui: "FeedbackUI", parent=None):
         super().__init__(parent)
+        self._feedback_ui = feedback_ui
 
     def keyPressEvent(self, event: QKeyEvent):
         if event.key() == Qt.Key_Return and event.modifiers() == Qt.ControlModifier:
-            # Find the parent FeedbackUI instance and call submit
-            parent = self.parent()
-            while parent and not isinstance(parent, FeedbackUI):
-                parent = parent.parent()
-            if parent:
-                parent._submit_feedback()
+            self._feedback_ui._submit_feedback()
         else:
             super().keyPressEvent(event)
 
 class LogSignals(QObject):
     append_log = Signal(str)
 
-class ClickableFileItem(QWidget):
-    """Custom widget for file items that can be clicked on text"""
-    def __init__(self, file_path: str, parent=None):
+class SettingsSignals(QObject):
+    write = Signal(str, object)
+    remove = Signal(str, str)
+    flush = Signal()
+
+class SettingsWriter(QObject):
+    """Applies QSettings writes on its own thread so disk I/O never blocks the UI"""
+    def __init__(self):
+        super().__init__()
+        self._settings: Optional[QSettings] = None
+
+    def _get(self) -> QSettings:
+        # Created on first use so the instance belongs to the writer thread
+        if self._settings is None:
+            self._settings = open_settings()
+        return self._settings
+
+    @Slot(str, object)
+    def write(self, group: str, values: dict):
+        """Write several keys of one group under a single beginGroup/endGroup"""
+        settings = self._get()
+        settings.beginGroup(group)
+        for key, value in values.items():
+            settings.setValue(key, value)
+        settings.endGroup()
+
+    @Slot(str, str)
+    def remove(self, group: str, key: str):
+        settings = self._get()
+        settings.beginGroup(group)
+        settings.remove(key)
+        settings.endGroup()
+
+    @Slot()
+    def flush(self):
+        self._get().sync()
+
+class _LabelToggleFilter(QObject):
+    """Toggles the checkbox mapped to a label when the label is clicked"""
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.file_path = file_path
-        # Default to checked only for .md files
-        self.is_checked = file_path.lower().endswith('.md')
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(3, 1, 3, 1)
-        
-        # Checkbox
-        self.checkbox = QCheckBox()
-        self.checkbox.setChecked(self.is_checked)
-        self.checkbox.stateChanged.connect(self._on_checkbox_changed)
-        
-        # File label that's clickable
-        self.file_label = QLabel(file_path)
-        self.file_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                padding: 2px;
-                border-radius: 2px;
-            }
-            QLabel:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                cursor: pointer;
-            }
-        """)
-        self.file_label.mousePressEvent = self._on_label_clicked
-        
-        # File size info
-        self.size_label = QLabel()
-        self.size_label.setStyleSheet("color: #888888; font-size: 9pt;")
-        self._update_size_info()
-        
-        layout.addWidget(self.checkbox)
-        layout.addWidget(self.file_label, 1)  # Take remaining space
-        layout.addWidget(self.size_label)
-        
-    def _update_size_info(self):
-        """Update file size information"""
-        try:
-            if hasattr(self.parent(), 'project_directory'):
-                full_path = os.path.join(self.parent().project_directory, self.file_path)
-            else:
-                # Fallback: try to get from main window
-                main_window = self
-                while main_window.parent():
-                    main_window = main_window.parent()
-                if hasattr(main_window, 'project_directory'):
-                    full_path = os.path.join(main_window.project_directory, self.file_path)
-                else:
-                    full_path = self.file_path
-                    
-            if os.path.exists(full_path):
-                size = os.path.getsize(full_path)
-                if size < 1024:
-                    self.size_label.setText(f"{size}B")
-                elif size < 1024 * 1024:
-                    self.size_label.setText(f"{size/1024:.1f}KB")
-                else:
-                    self.size_label.setText(f"{size/(1024*1024):.1f}MB")
-            else:
-                self.size_label.setText("N/A")
-        except:
-            self.size_label.setText("")
-    
-    def _on_checkbox_changed(self, state):
-        self.is_checked = state == Qt.Checked
-        if hasattr(self.parent(), '_notify_selection_changed'):
-            self.parent()._notify_selection_changed(self.file_path, self.is_checked)
-    
-    def _on_label_clicked(self, event):
-        """Toggle checkbox when label is clicked"""
-        self.checkbox.setChecked(not self.checkbox.isChecked())
-        
-    def setChecked(self, checked: bool):
-        self.checkbox.setChecked(checked)
-        
-    def isChecked(self) -> bool:
-        return self.checkbox.isChecked()
+        self._checkboxes = {}
+
+    def add(self, label: QLabel, checkbox: QCheckBox):
+        self._checkboxes[label] = checkbox
+        label.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.MouseButtonPress:
+            checkbox = self._checkboxes.get(watched)
+            if checkbox is not None:
+                checkbox.toggle()
+                return True
+        return False
+
+class SelectedFilesIndex:
+    """Set of selected file paths stored as parallel arrays.
+
+    Each path's suffix and test flag are computed once when it is added, so
+    classifying the selection never re-lowercases or re-splits a path.
+    """
+    def __init__(self, paths=()):
+        self.paths: List[str] = []
+        self.suffixes: List[str] = []
+        self.is_test = bytearray()
+        self._index: dict[str, int] = {}
+        self.update(paths)
+
+    def add(self, path: str):
+        if path in self._index:
+            return
+        self._index[path] = len(self.paths)
+        self.paths.append(path)
+        self.suffixes.append(os.path.splitext(path)[1])
+        self.is_test.append('test' in path.lower())
+
+    def update(self, paths):
+        for path in paths:
+            self.add(path)
+
+    def discard(self, path: str):
+        i = self._index.pop(path, None)
+        if i is None:
+            return
+        # Move the last entry into the hole so removal stays O(1)
+        last = len(self.paths) - 1
+        if i != last:
+            moved = self.paths[last]
+            self.paths[i] = moved
+            self.suffixes[i] = self.suffixes[last]
+            self.is_test[i] = self.is_test[last]
+            self._index[moved] = i
+        self.paths.pop()
+        self.suffixes.pop()
+        del self.is_test[last]
+
+    def clear(self):
+        self.paths.clear()
+        self.suffixes.clear()
+        self.is_test.clear()
+        self._index.clear()
+
+    def __contains__(self, path) -> bool:
+        return path in self._index
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self):
+        return iter(self.paths)
+
+class ModifiedFilesModel(QAbstractListModel):
+    """List model of modified files, one (path, size text, checked) row per file"""
+    SizeRole = Qt.UserRole + 1
+
+    check_toggled = Signal(str, bool)
 
-class FileListWidget(QScrollArea):
-    """Custom file list widget with clickable text"""
     def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[list] = []
+
+    def add_files(self, rows: List[tuple]):
+        """Append (path, size_text, checked) rows"""
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+        self._rows.extend(list(row) for row in rows)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path, size_text, checked = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return path
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if checked else Qt.Unchecked
+        if role == self.SizeRole:
+            return size_text
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        self.set_checked(index.row(), Qt.CheckState(value) == Qt.Checked)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    def sort_key(self, row: int):
+        path, _, checked = self._rows[row]
+        # False comes before True, so checked items first
+        return (not checked, path)
+
+    def set_checked(self, row: int, checked: bool):
+        file_row = self._rows[row]
+        if file_row[2] == checked:
+            return
+        file_row[2] = checked
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.check_toggled.emit(file_row[0], checked)
+
+    def set_all_checked(self, checked: bool):
+        """Check or uncheck every row with one dataChanged instead of one per row.
+
+        check_toggled is not emitted here; callers update their selection in bulk.
+        """
+        if not self._rows:
+            return
+        for file_row in self._rows:
+            file_row[2] = checked
+        self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), [Qt.CheckStateRole])
+
+    def selected_files(self) -> List[str]:
+        return [path for path, _, checked in self._rows if checked]
+
+class FileSortProxyModel(QSortFilterProxyModel):
+    """Shows checked files first, then sorts by path"""
+    def lessThan(self, left, right):
+        model = self.sourceModel()
+        return model.sort_key(left.row()) < model.sort_key(right.row())
+
+class FileRowDelegate(QStyledItemDelegate):
+    """Paints a file row as checkbox, elided path and right-aligned size"""
+    MARGIN = 3
+    SPACING = 6
+
+    def __init__(self, size_font: QFont, parent=None):
+        super().__init__(parent)
+        self._size_font = size_font
+        self._size_metrics = QFontMetrics(size_font)
+
+    def _style(self, option):
+        return option.widget.style() if option.widget else QApplication.style()
+
+    def _check_rect(self, option, style) -> QRect:
+        width = style.pixelMetric(QStyle.PM_IndicatorWidth, None, option.widget)
+        height = style.pixelMetric(QStyle.PM_IndicatorHeight, None, option.widget)
+        top = option.rect.top() + (option.rect.height() - height) // 2
+        return QRect(option.rect.left() + self.MARGIN, top, width, height)
+
+    def paint(self, painter, option, index):
+        style = self._style(option)
+        painter.save()
+
+        if option.state & QStyle.State_MouseOver:
+            painter.fillRect(option.rect, QColor(255, 255, 255, 25))
+
+        # Checkbox
+        check = QStyleOptionButton()
+        check.rect = self._check_rect(option, style)
+        check.state = QStyle.State_Enabled
+        check.state |= QStyle.State_On if index.data(Qt.CheckStateRole) == Qt.Checked else QStyle.State_Off
+        style.drawControl(QStyle.CE_CheckBox, check, painter, option.widget)
+
+        # File size info, right aligned
+        size_text = index.data(ModifiedFilesModel.SizeRole) or ""
+        size_width = self._size_metrics.horizontalAdvance(size_text)
+        size_rect = QRect(option.rect.right() - self.MARGIN - size_width, option.rect.top(), size_width, option.rect.height())
+        painter.setFont(self._size_font)
+        painter.setPen(QColor(136, 136, 136))
+        painter.drawText(size_rect, Qt.AlignRight | Qt.AlignVCenter, size_text)
+
+        # File path, elided in the middle so the file name stays visible
+        text_left = check.rect.right() + self.SPACING
+        text_rect = QRect(text_left, option.rect.top(), size_rect.left() - self.SPACING - text_left, option.rect.height())
+        path = option.fontMetrics.elidedText(index.data(Qt.DisplayRole), Qt.ElideMiddle, text_rect.width())
+        painter.setFont(option.font)
+        painter.setPen(option.palette.color(QPalette.Text))
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, path)
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        style = self._style(option)
+        height = max(option.fontMetrics.height(), style.pixelMetric(QStyle.PM_IndicatorHeight, None, option.widget))
+        return QSize(0, height + 2 * self.MARGIN)
+
+    def editorEvent(self, event, model, option, index):
+        """Toggle the row when it is clicked anywhere, not just on the checkbox"""
+        if event.type() == QEvent.MouseButtonRelease:
+            if event.button() != Qt.LeftButton:
+                return False
+        elif event.type() == QEvent.KeyPress:
+            if event.key() not in (Qt.Key_Space, Qt.Key_Select):
+                return False
+        else:
+            return False
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
+
+class FileListWidget(QListView):
+    """Custom file list widget with clickable rows.
+
+    Rows are painted by FileRowDelegate, so only the visible ones cost anything
+    no matter how many files were modified.
+    """
+    def __init__(self, small_font: QFont, parent=None):
         super().__init__(parent)
         self.main_window = None
-        
-        # Container widget
-        self.container = QWidget()
-        self.layout = QVBoxLayout(self.container)
-        self.layout.setContentsMargins(2, 2, 2, 2)
-        self.layout.setSpacing(0)
-        
-        # Setup scroll area
-        self.setWidget(self.container)
-        self.setWidgetResizable(True)
+
+        self.file_model = ModifiedFilesModel(self)
+        self.file_model.check_toggled.connect(self._notify_selection_changed)
+        self.proxy_model = FileSortProxyModel(self)
+        self.proxy_model.setSourceModel(self.file_model)
+        self.proxy_model.setDynamicSortFilter(False)
+        self.proxy_model.sort(0)
+
+        self.setModel(self.proxy_model)
+        self.setItemDelegate(FileRowDelegate(small_font, self))
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setUniformItemSizes(True)
+        self.viewport().setAttribute(Qt.WA_Hover)
         self.setMaximumHeight(120)  # Smaller height
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        
-        # Style
-        self.setStyleSheet("""
-            QScrollArea {
-                border: 1px solid #555555;
-                border-radius: 4px;
-                background-color: #2b2b2b;
-            }
-        """)
-        
-        self.file_items = {}
+
+        # Style (see APP_QSS)
+        self.setObjectName("fileList")
+
+        # Re-sort once per event loop pass, however many rows changed
+        self._resort_timer = QTimer(self)
+        self._resort_timer.setSingleShot(True)
+        self._resort_timer.setInterval(0)
+        self._resort_timer.timeout.connect(self.proxy_model.invalidate)
+        self.file_model.dataChanged.connect(lambda *args: self._resort_timer.start())
         
     def set_main_window(self, main_window):
         """Set reference to main window for project directory access"""
         self.main_window = main_window
-        
-    def add_file(self, file_path: str):
-        """Add a file to the list"""
-        item = ClickableFileItem(file_path, self)
-        # Set project directory for size calculation
-        if self.main_window and hasattr(self.main_window, 'project_directory'):
-            item.project_directory = self.main_window.project_directory
-        self.file_items[file_path] = item
-        self.layout.addWidget(item)
+
+    def add_files(self, file_paths: List[str], checked: Set[str]):
+        """Add files, reading their sizes with one directory scan per folder"""
+        file_paths = list(dict.fromkeys(file_paths))
+        sizes = self._scan_file_sizes(file_paths)
+        self.file_model.add_files([
+            (file_path, self._size_text(file_path, sizes), file_path in checked)
+            for file_path in file_paths
+        ])
+        self.proxy_model.invalidate()
+
+    def _full_path(self, file_path: str) -> str:
+        if self.main_window is None:
+            return file_path
+        return self.main_window._full_path(file_path)
+
+    def _scan_file_sizes(self, file_paths: List[str]) -> dict[str, int]:
+        """Get file sizes from os.scandir entries instead of a stat per file"""
+        by_dir: dict[str, dict[str, str]] = {}
+        for file_path in file_paths:
+            directory, name = os.path.split(file_path)
+            by_dir.setdefault(directory, {})[name] = file_path
+
+        sizes = {}
+        residual: List[str] = []
+        for directory, names in by_dir.items():
+            if len(names) == 1:
+                # Reading a whole directory for a single file costs more than one stat
+                residual.extend(names.values())
+                continue
+            try:
+                with os.scandir(self._full_path(directory)) as entries:
+                    for entry in entries:
+                        file_path = names.get(entry.name)
+                        if file_path is not None and entry.is_file():
+                            sizes[file_path] = entry.stat().st_size
+            except OSError:
+                # Missing or unreadable directory: fall back to a per-file lookup
+                residual.extend(names.values())
+
+        if residual:
+            # stat() releases the GIL, so slow filesystems (network shares, WSL mounts)
+            # answer these lookups concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(residual))) as executor:
+                for file_path, size in zip(residual, executor.map(self._stat_size, residual)):
+                    if size is not None:
+                        sizes[file_path] = size
+        return sizes
+
+    def _stat_size(self, file_path: str) -> Optional[int]:
+        try:
+            return os.path.getsize(self._full_path(file_path))
+        except OSError:
+            return None
+
+    def _size_text(self, file_path: str, sizes: dict[str, int]) -> str:
+        """Format file size information"""
+        size = sizes.get(file_path)
+        if size is None:
+            return "N/A"
+        if size < 1024:
+            return f"{size}B"
+        elif size < 1024 * 1024:
+            return f"{size/1024:.1f}KB"
+        return f"{size/(1024*1024):.1f}MB"
         
     def _notify_selection_changed(self, file_path: str, is_checked: bool):
         """Notify main window of selection changes"""
         if self.main_window and hasattr(self.main_window, '_on_file_selection_changed_new'):
             self.main_window._on_file_selection_changed_new(file_path, is_checked)
-        # Reorder files after selection change
-        self._reorder_files()
             
-    def _reorder_files(self):
-        """Reorder files to show checked files at the top"""
-        # Get all file items and sort them: checked first, then unchecked
-        sorted_items = sorted(
-            self.file_items.items(),
-            key=lambda x: (not x[1].isChecked(), x[0])  # False comes before True, so checked items first
-        )
-        
-        # Remove all widgets from layout
-        for file_path, item in self.file_items.items():
-            self.layout.removeWidget(item)
-        
-        # Add widgets back in sorted order
-        for file_path, item in sorted_items:
-            self.layout.addWidget(item)
+    def _set_all_checked(self, checked: bool):
+        # One model update and one repaint, however many files are listed
+        self.viewport().setUpdatesEnabled(False)
+        try:
+            self.file_model.set_all_checked(checked)
+        finally:
+            self.viewport().setUpdatesEnabled(True)
             
     def select_all(self):
         """Select all files"""
-        for item in self.file_items.values():
-            item.setChecked(True)
-        self._reorder_files()
+        self._set_all_checked(True)
             
     def deselect_all(self):
         """Deselect all files"""
-        for item in self.file_items.values():
-            item.setChecked(False)
-        self._reorder_files()
+        self._set_all_checked(False)
             
     def get_selected_files(self) -> List[str]:
         """Get list of selected files"""
-        return [path for path, item in self.file_items.items() if item.isChecked()]
+        return self.file_model.selected_files()
 
 class FeedbackUI(QMainWindow):
+    # Ctrl+1-6 quick feedback shortcuts
+    _QUICK_FEEDBACK = (
+        ("Ctrl+1", "Looks good, continue with the implementation."),
+        ("Ctrl+2", "I have some questions about this approach."),
+        ("Ctrl+3", "There are some issues that need to be addressed."),
+        ("Ctrl+4", "Please add tests for these changes."),
+        ("Ctrl+5", "Perfect! These changes look great."),
+        ("Ctrl+6", "Stop here, I want to review manually."),
+    )
+
     def __init__(self, project_directory: str, prompt: str, modified_files: Optional[List[str]] = None):
         super().__init__()
         self.project_directory = project_directory
+        # With a trailing separator, so relative paths resolve by plain concatenation
+        self._project_dir_prefix = os.path.join(project_directory, "")
         self.prompt = prompt
         self.modified_files = modified_files or []
-        self.selected_files = set()  # Track which files are selected
+        self.selected_files = SelectedFilesIndex()  # Track which files are selected
+        self.file_list: Optional[FileListWidget] = None  # Only created when there are modified files
 
         self.process: Optional[subprocess.Popen] = None
+        self._job = None
         self.log_buffer = []
         self.feedback_result = None
         self.log_signals = LogSignals()
         self.log_signals.append_log.connect(self._append_log)
+        # Console output is shown in batches, at most once every 30ms
+        self._pending_log_chunks: List[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(30)
+        self._log_flush_timer.timeout.connect(self._flush_log)
 
         self.setWindowTitle("Interactive Feedback MCP")
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -400,11 +747,21 @@ class FeedbackUI(QMainWindow):
         self.setWindowIcon(QIcon(icon_path))
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
         
-        self.settings = QSettings("InteractiveFeedbackMCP", "InteractiveFeedbackMCP")
+        self.settings = get_settings()
+
+        # Writes go through the settings writer thread; self.settings is only read from.
+        # QSettings objects in one process share their cache, so reads see queued writes once applied.
+        self._settings_signals = get_settings_writer()
+
+        # Fonts shared by every small label, file row and the console
+        self._small_font = QFont()
+        self._small_font.setPointSize(9)
+        self._mono_font = QFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self._mono_font.setPointSize(9)
         
         # Load general UI settings for the main window (geometry, state)
-        self.settings.beginGroup("MainWindow_General")
-        geometry = self.settings.value("geometry")
+        general_settings = read_settings_group(self.settings, "MainWindow_General")
+        geometry = general_settings.get("geometry")
         if geometry:
             self.restoreGeometry(geometry)
         else:
@@ -413,18 +770,21 @@ class FeedbackUI(QMainWindow):
             x = (screen.width() - 650) // 2
             y = (screen.height() - 550) // 2
             self.move(x, y)
-        state = self.settings.value("windowState")
+        state = general_settings.get("windowState")
         if state:
             self.restoreState(state)
-        self.settings.endGroup() # End "MainWindow_General" group
         
         # Load project-specific settings (command, auto-execute, command section visibility)
         self.project_group_name = get_project_settings_group(self.project_directory)
-        self.settings.beginGroup(self.project_group_name)
-        loaded_run_command = self.settings.value("run_command", "", type=str)
-        loaded_execute_auto = self.settings.value("execute_automatically", False, type=bool)
-        command_section_visible = self.settings.value("commandSectionVisible", False, type=bool)
-        self.settings.endGroup() # End project-specific group
+        # Read once and kept in memory; later reads come from here and changed keys are written on close
+        self._settings_cache = read_settings_group(self.settings, self.project_group_name)
+        self._dirty_settings: set[str] = set()
+        loaded_run_command = str(self._settings_cache.get("run_command", ""))
+        loaded_execute_auto = settings_bool(self._settings_cache.get("execute_automatically"), False)
+        command_section_visible = settings_bool(self._settings_cache.get("commandSectionVisible"), False)
+        # Last persisted values, so unchanged ones are not written again
+        self._last_command_visible = command_section_visible
+        self._last_draft_text = self._settings_cache.get("feedback_draft")
         
         self.config: FeedbackConfig = {
             "run_command": loaded_run_command,
@@ -434,6 +794,8 @@ class FeedbackUI(QMainWindow):
         self._create_ui() # self.config is used here to set initial values
 
         # Set command section visibility AFTER _create_ui has created relevant widgets
+        if command_section_visible or self.config["execute_automatically"]:
+            self._ensure_command_section()
         self.command_group.setVisible(command_section_visible)
         if command_section_visible:
             self.toggle_command_button.setText("Hide Command Section")
@@ -451,13 +813,16 @@ class FeedbackUI(QMainWindow):
         if self.config.get("execute_automatically", False):
             self._run_command()
 
-    def _format_windows_path(self, path: str) -> str:
-        if sys.platform == "win32":
-            # Convert forward slashes to backslashes
-            path = path.replace("/", "\\")
-            # Capitalize drive letter if path starts with x:\
-            if len(path) >= 2 and path[1] == ":" and path[0].isalpha():
-                path = path[0].upper() + path[1:]
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_windows_path(path: str) -> str:
+        if not _IS_WIN:
+            return path
+        # Convert forward slashes to backslashes
+        path = path.translate(_SLASH_TRANS)
+        # Capitalize drive letter if path starts with x:\
+        if len(path) >= 2 and path[1] == ":" and path[0].isalpha():
+            path = path[0].upper() + path[1:]
         return path
 
     def _create_ui(self):
@@ -472,7 +837,69 @@ class FeedbackUI(QMainWindow):
 
         # Command section
         self.command_group = QGroupBox("Command")
-        command_layout = QVBoxLayout(self.command_group)
+        # Its contents are built on first show (see _ensure_command_section)
+        QVBoxLayout(self.command_group)
+        self._command_built = False
+
+        self.command_group.setVisible(False) 
+        layout.addWidget(self.command_group)
+
+        # File Changes section (only show if modified_files provided)
+        if self.modified_files:
+            self._create_file_changes_section(layout)
+
+        # Rules section
+        self._create_rules_section(layout)
+
+        # Quick Actions section
+        self._create_quick_actions_section(layout)
+
+        # Feedback section with adjusted height
+        self.feedback_group = QGroupBox("Feedback")
+        feedback_layout = QVBoxLayout(self.feedback_group)
+
+        # Short description label (from self.prompt)
+        self.description_label = QLabel(self.prompt)
+        self.description_label.setWordWrap(True)
+        feedback_layout.addWidget(self.description_label)
+
+        self.feedback_text = FeedbackTextEdit(self)
+        font_metrics = self.feedback_text.fontMetrics()
+        row_height = font_metrics.height()
+        # Calculate height for 5 lines + some padding for margins
+        padding = self.feedback_text.contentsMargins().top() + self.feedback_text.contentsMargins().bottom() + 5 # 5 is extra vertical padding
+        self.feedback_text.setMinimumHeight(5 * row_height + padding)
+
+        self.feedback_text.setPlaceholderText("Enter your feedback here (Ctrl+Enter to submit)")
+        submit_button = QPushButton("&Send Feedback (Ctrl+Enter)")
+        submit_button.clicked.connect(self._submit_feedback)
+
+        feedback_layout.addWidget(self.feedback_text)
+        feedback_layout.addWidget(submit_button)
+
+        # Set minimum height for feedback_group to accommodate its contents
+        # This will be based on the description label and the 5-line feedback_text
+        self.feedback_group.setMinimumHeight(self.description_label.sizeHint().height() + self.feedback_text.minimumHeight() + submit_button.sizeHint().height() + feedback_layout.spacing() * 2 + feedback_layout.contentsMargins().top() + feedback_layout.contentsMargins().bottom() + 10) # 10 for extra padding
+
+        # Add widgets in a specific order
+        layout.addWidget(self.feedback_group)
+
+
+
+        # Credits/Contact Label
+        contact_label = QLabel('Enhanced by AI • Contact Fábio Ferreira on <a href="https://x.com/fabiomlferreira">X.com</a> or visit <a href="https://dotcursorrules.com/">dotcursorrules.com</a>')
+        contact_label.setOpenExternalLinks(True)
+        contact_label.setAlignment(Qt.AlignCenter)
+        contact_label.setObjectName("contactLabel")
+        contact_label.setFont(self._small_font)
+        layout.addWidget(contact_label)
+
+    def _ensure_command_section(self):
+        """Build the command and console widgets the first time they are needed"""
+        if self._command_built:
+            return
+        self._command_built = True
+        command_layout = self.command_group.layout()
 
         # Working directory label
         formatted_path = self._format_windows_path(self.project_directory)
@@ -512,11 +939,9 @@ class FeedbackUI(QMainWindow):
         console_group.setMinimumHeight(200)
 
         # Log text area
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        font = QFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
-        font.setPointSize(9)
-        self.log_text.setFont(font)
+        self.log_text.setFont(self._mono_font)
         console_layout_internal.addWidget(self.log_text)
 
         # Clear button
@@ -529,58 +954,6 @@ class FeedbackUI(QMainWindow):
         
         command_layout.addWidget(console_group)
 
-        self.command_group.setVisible(False) 
-        layout.addWidget(self.command_group)
-
-        # File Changes section (only show if modified_files provided)
-        if self.modified_files:
-            self._create_file_changes_section(layout)
-
-        # Rules section
-        self._create_rules_section(layout)
-
-        # Quick Actions section
-        self._create_quick_actions_section(layout)
-
-        # Feedback section with adjusted height
-        self.feedback_group = QGroupBox("Feedback")
-        feedback_layout = QVBoxLayout(self.feedback_group)
-
-        # Short description label (from self.prompt)
-        self.description_label = QLabel(self.prompt)
-        self.description_label.setWordWrap(True)
-        feedback_layout.addWidget(self.description_label)
-
-        self.feedback_text = FeedbackTextEdit()
-        font_metrics = self.feedback_text.fontMetrics()
-        row_height = font_metrics.height()
-        # Calculate height for 5 lines + some padding for margins
-        padding = self.feedback_text.contentsMargins().top() + self.feedback_text.contentsMargins().bottom() + 5 # 5 is extra vertical padding
-        self.feedback_text.setMinimumHeight(5 * row_height + padding)
-
-        self.feedback_text.setPlaceholderText("Enter your feedback here (Ctrl+Enter to submit)")
-        submit_button = QPushButton("&Send Feedback (Ctrl+Enter)")
-        submit_button.clicked.connect(self._submit_feedback)
-
-        feedback_layout.addWidget(self.feedback_text)
-        feedback_layout.addWidget(submit_button)
-
-        # Set minimum height for feedback_group to accommodate its contents
-        # This will be based on the description label and the 5-line feedback_text
-        self.feedback_group.setMinimumHeight(self.description_label.sizeHint().height() + self.feedback_text.minimumHeight() + submit_button.sizeHint().height() + feedback_layout.spacing() * 2 + feedback_layout.contentsMargins().top() + feedback_layout.contentsMargins().bottom() + 10) # 10 for extra padding
-
-        # Add widgets in a specific order
-        layout.addWidget(self.feedback_group)
-
-
-
-        # Credits/Contact Label
-        contact_label = QLabel('Enhanced by AI • Contact Fábio Ferreira on <a href="https://x.com/fabiomlferreira">X.com</a> or visit <a href="https://dotcursorrules.com/">dotcursorrules.com</a>')
-        contact_label.setOpenExternalLinks(True)
-        contact_label.setAlignment(Qt.AlignCenter)
-        contact_label.setStyleSheet("font-size: 9pt; color: #cccccc;") # Light gray for dark theme
-        layout.addWidget(contact_label)
-
     def _create_file_changes_section(self, layout):
         """Create the file changes section with clickable files"""
         self.file_changes_group = QGroupBox("Modified Files")
@@ -591,7 +964,7 @@ class FeedbackUI(QMainWindow):
         
         # File count info
         file_count_label = QLabel(f"{len(self.modified_files)} files")
-        file_count_label.setStyleSheet("color: #cccccc; font-size: 10pt;")
+        file_count_label.setObjectName("fileCountLabel")
         
         # Control buttons (smaller)
         select_all_btn = QPushButton("All")
@@ -600,7 +973,7 @@ class FeedbackUI(QMainWindow):
         # Make buttons smaller
         for btn in [select_all_btn, deselect_all_btn]:
             btn.setMaximumWidth(50)
-            btn.setStyleSheet("font-size: 9pt; padding: 2px 6px;")
+            btn.setObjectName("smallButton")
         
         select_all_btn.clicked.connect(self._select_all_files)
         deselect_all_btn.clicked.connect(self._deselect_all_files)
@@ -612,17 +985,13 @@ class FeedbackUI(QMainWindow):
         file_changes_layout.addLayout(info_controls_layout)
 
         # Custom file list
-        self.file_list = FileListWidget(self)
+        self.file_list = FileListWidget(self._small_font, self)
         self.file_list.set_main_window(self)
         
-        for file_path in self.modified_files:
-            self.file_list.add_file(file_path)
-            # Only add .md files to selected_files by default
-            if file_path.lower().endswith('.md'):
-                self.selected_files.add(file_path)
-        
-        # Reorder files to show checked files at the top initially
-        self.file_list._reorder_files()
+        # Only .md files are selected by default
+        md_files = {p for p in self.modified_files if os.path.splitext(p)[1].lower() == '.md'}
+        self.selected_files.update(md_files)
+        self.file_list.add_files(self.modified_files, md_files)
         
         file_changes_layout.addWidget(self.file_list)
         layout.addWidget(self.file_changes_group)
@@ -642,7 +1011,7 @@ class FeedbackUI(QMainWindow):
 
         for text, feedback in main_actions:
             btn = QPushButton(text)
-            btn.setStyleSheet("font-size: 10pt; padding: 4px 8px;")
+            btn.setObjectName("quickAction")
             btn.clicked.connect(lambda checked, f=feedback: self._set_quick_feedback(f))
             main_actions_layout.addWidget(btn)
 
@@ -656,7 +1025,7 @@ class FeedbackUI(QMainWindow):
 
         for text, feedback in secondary_actions:
             btn = QPushButton(text)
-            btn.setStyleSheet("font-size: 10pt; padding: 4px 8px;")
+            btn.setObjectName("quickAction")
             btn.clicked.connect(lambda checked, f=feedback: self._set_quick_feedback(f))
             secondary_actions_layout.addWidget(btn)
 
@@ -665,17 +1034,17 @@ class FeedbackUI(QMainWindow):
         
         # Preview button
         self.preview_btn = QPushButton("👁️ Preview")
-        self.preview_btn.setStyleSheet("font-size: 9pt; padding: 2px 6px;")
+        self.preview_btn.setObjectName("smallButton")
         self.preview_btn.clicked.connect(self._show_file_preview)
         
         # Smart suggestions button
         self.smart_btn = QPushButton("🤖 Smart")
-        self.smart_btn.setStyleSheet("font-size: 9pt; padding: 2px 6px;")
+        self.smart_btn.setObjectName("smallButton")
         self.smart_btn.clicked.connect(self._show_smart_suggestions)
         
         # Clear button
         clear_btn = QPushButton("🗑️ Clear")
-        clear_btn.setStyleSheet("font-size: 9pt; padding: 2px 6px;")
+        clear_btn.setObjectName("smallButton")
         clear_btn.clicked.connect(lambda: self.feedback_text.clear())
         
         advanced_layout.addWidget(self.preview_btn)
@@ -702,6 +1071,7 @@ class FeedbackUI(QMainWindow):
         
         # Define the rules as specified in the task
         self.rules_checkboxes = {}
+        self._rule_label_filter = _LabelToggleFilter(self.rules_group)
         rules_config = [
             ("single_operation", "ALWAYS BATCH EDIT: GROUP all EDITS on the SAME FILE into ONE OPERATION, do NOT use MULTIPLE CALLS, READ ENTIRE FILE in ONE CALL, do NOT CREATE or MODIFY other FILES unless REQUESTED, applies to ALL TOOL CALLS."),
             ("no_new_md", "AFTER EVERY ACTION OR RESPONSE, THE AGENT MUST CALL MCP interactive_feedback — WITHOUT EXCEPTION — AND MUST NOT COMPLETE OR END THE PROCESS UNTIL USER FEEDBACK IS EMPTY."),
@@ -722,18 +1092,13 @@ class FeedbackUI(QMainWindow):
             
             # Create label with word wrap for the text
             label = QLabel(rule_text)
-            label.setStyleSheet("color: #ffffff; font-size: 9pt;")
+            label.setObjectName("ruleLabel")
+            label.setFont(self._small_font)
             label.setWordWrap(True)
             label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
             
             # Make label clickable to toggle checkbox
-            def make_label_clickable(cb):
-                def label_clicked(event):
-                    cb.setChecked(not cb.isChecked())
-                return label_clicked
-            
-            label.mousePressEvent = make_label_clickable(checkbox)
-            label.setStyleSheet("color: #ffffff; font-size: 9pt; cursor: pointer;")
+            self._rule_label_filter.add(label, checkbox)
             
             container_layout.addWidget(checkbox)
             container_layout.addWidget(label)
@@ -744,9 +1109,7 @@ class FeedbackUI(QMainWindow):
             checkbox.rule_label = label
             
             # Load saved state for this rule (default to True)
-            self.settings.beginGroup(self.project_group_name)
-            saved_state = self.settings.value(f"rule_{rule_key}", True, type=bool)
-            self.settings.endGroup()
+            saved_state = settings_bool(self._settings_cache.get(f"rule_{rule_key}"), True)
             
             # Set initial state
             checkbox.setChecked(True)
@@ -780,12 +1143,19 @@ class FeedbackUI(QMainWindow):
             sender._initial_state = checked
     
     def _save_rule_state(self, rule_key: str, checked: bool):
-        """Save rule checkbox state"""
-        self.settings.beginGroup(self.project_group_name)
-        self.settings.setValue(f"rule_{rule_key}", checked)
-        self.settings.endGroup()
-        # Force sync to ensure settings are saved immediately
-        self.settings.sync()
+        """Save rule checkbox state (written on close)"""
+        key = f"rule_{rule_key}"
+        if settings_bool(self._settings_cache.get(key), True) == checked:
+            return
+        self._settings_cache[key] = checked
+        self._dirty_settings.add(key)
+
+    def _flush_dirty_settings(self):
+        """Write cached project settings that changed since they were loaded, as one batch"""
+        if not self._dirty_settings:
+            return
+        self._write_settings(self.project_group_name, {key: self._settings_cache[key] for key in self._dirty_settings})
+        self._dirty_settings.clear()
 
 
     
@@ -801,17 +1171,19 @@ class FeedbackUI(QMainWindow):
 
     def _select_all_files(self):
         """Select all files in the list"""
-        if hasattr(self, 'file_list'):
-            self.file_list.select_all()
-            # Update selected_files set to include all files
-            self.selected_files = set(self.modified_files)
+        if self.file_list is None:
+            return
+        self.file_list.select_all()
+        # Update selected_files to include all files
+        self.selected_files = SelectedFilesIndex(self.modified_files)
 
     def _deselect_all_files(self):
         """Deselect all files in the list"""
-        if hasattr(self, 'file_list'):
-            self.file_list.deselect_all()
-            # Clear selected_files set
-            self.selected_files.clear()
+        if self.file_list is None:
+            return
+        self.file_list.deselect_all()
+        # Clear selected_files
+        self.selected_files.clear()
 
     def _on_file_selection_changed_new(self, file_path: str, is_checked: bool):
         """Handle file selection changes from custom widget"""
@@ -843,116 +1215,119 @@ class FeedbackUI(QMainWindow):
             self._set_quick_feedback(f"📄 Preview: {len(self.selected_files)} files selected (too many to preview, will include in context)")
             return
             
-        preview_lines = []
-        preview_lines.append("📄 File Preview:")
-        preview_lines.append("")
+        buf = io.StringIO()
+        buf.write("📄 File Preview:\n\n")
         
         for file_path in sorted(list(self.selected_files)[:3]):  # Max 3 files
-            full_path = os.path.join(self.project_directory, file_path)
+            full_path = self._full_path(file_path)
+            # Stream the file: keep the first 3 lines, only count the rest
+            first_lines = []
+            line_count = 1
+            char_count = 0
             try:
-                if os.path.exists(full_path):
-                    with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    lines = content.split('\n')
-                    size_info = f"{len(lines)} lines, {len(content)} chars"
-                    
-                    preview_lines.append(f"• {file_path} ({size_info})")
-                    
-                    # Show first few lines
-                    for i, line in enumerate(lines[:3]):
-                        preview_lines.append(f"  {i+1}: {line}")
-                    if len(lines) > 3:
-                        preview_lines.append(f"  ... ({len(lines) - 3} more lines)")
-                    preview_lines.append("")
-                else:
-                    preview_lines.append(f"• {file_path} (file not found)")
-                    preview_lines.append("")
+                with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    for line in f:
+                        char_count += len(line)
+                        if line.endswith('\n'):
+                            line_count += 1
+                        if len(first_lines) < 3:
+                            first_lines.append(line.rstrip('\n'))
+            except FileNotFoundError:
+                buf.write(f"• {file_path} (file not found)\n\n")
+                continue
             except Exception as e:
-                preview_lines.append(f"• {file_path} (error: {str(e)})")
-                preview_lines.append("")
+                buf.write(f"• {file_path} (error: {str(e)})\n\n")
+                continue
+
+            buf.write(f"• {file_path} ({line_count} lines, {char_count} chars)\n")
+            
+            # Show first few lines
+            for i, line in enumerate(first_lines):
+                buf.write(f"  {i+1}: {line}\n")
+            if line_count > 3:
+                buf.write(f"  ... ({line_count - 3} more lines)\n")
+            buf.write("\n")
         
-        preview_lines.append("👆 Ready to include full content in feedback.")
-        self.feedback_text.setPlainText('\n'.join(preview_lines))
+        buf.write("👆 Ready to include full content in feedback.")
+        self.feedback_text.setPlainText(buf.getvalue())
         
     def _show_smart_suggestions(self):
         """Show smart suggestions based on file types and patterns"""
         if not self.selected_files:
-            suggestions = [
-                "🤖 Smart Suggestions:",
-                "",
-                "• General feedback: Continue with the implementation",
-                "• If you see issues: Please fix the errors I mentioned",
-                "• If you need more: Let's discuss this approach further",
+            self.feedback_text.setPlainText(
+                "🤖 Smart Suggestions:\n"
+                "\n"
+                "• General feedback: Continue with the implementation\n"
+                "• If you see issues: Please fix the errors I mentioned\n"
+                "• If you need more: Let's discuss this approach further\n"
                 "• If it's good: Perfect! These changes look great"
-            ]
-        else:
-            suggestions = ["🤖 Smart Suggestions based on files:"]
-            suggestions.append("")
+            )
+            return
+
+        buf = io.StringIO()
+        buf.write("🤖 Smart Suggestions based on files:\n\n")
+        
+        # Analyze file types from the suffixes and test flags computed on selection
+        suffixes = set(self.selected_files.suffixes)
+        has_tests = any(self.selected_files.is_test)
+        has_python = '.py' in suffixes
+        has_js = not suffixes.isdisjoint(('.js', '.ts', '.jsx', '.tsx'))
+        has_config = not suffixes.isdisjoint(('.json', '.yaml', '.yml', '.toml', '.ini'))
+        
+        if has_tests:
+            buf.write(
+                "🧪 Test files detected:\n"
+                "• 'Run the tests to make sure they pass'\n"
+                "• 'Add more test cases for edge cases'\n\n"
+            )
             
-            # Analyze file types
-            python_files = [f for f in self.selected_files if f.endswith('.py')]
-            js_files = [f for f in self.selected_files if f.endswith(('.js', '.ts', '.jsx', '.tsx'))]
-            test_files = [f for f in self.selected_files if 'test' in f.lower() or f.endswith('_test.py')]
-            config_files = [f for f in self.selected_files if f.endswith(('.json', '.yaml', '.yml', '.toml', '.ini'))]
+        if has_python:
+            buf.write(
+                "🐍 Python files detected:\n"
+                "• 'Check for PEP 8 compliance'\n"
+                "• 'Add type hints if missing'\n"
+                "• 'Consider adding docstrings'\n\n"
+            )
             
-            if test_files:
-                suggestions.append("🧪 Test files detected:")
-                suggestions.append("• 'Run the tests to make sure they pass'")
-                suggestions.append("• 'Add more test cases for edge cases'")
-                suggestions.append("")
-                
-            if python_files:
-                suggestions.append("🐍 Python files detected:")
-                suggestions.append("• 'Check for PEP 8 compliance'")
-                suggestions.append("• 'Add type hints if missing'")
-                suggestions.append("• 'Consider adding docstrings'")
-                suggestions.append("")
-                
-            if js_files:
-                suggestions.append("📜 JavaScript/TypeScript files detected:")
-                suggestions.append("• 'Run linter and fix any issues'")
-                suggestions.append("• 'Check for proper error handling'")
-                suggestions.append("• 'Ensure proper TypeScript types'")
-                suggestions.append("")
-                
-            if config_files:
-                suggestions.append("⚙️ Config files detected:")
-                suggestions.append("• 'Validate configuration syntax'")
-                suggestions.append("• 'Check if all required fields are present'")
-                suggestions.append("")
-                
-            # File count based suggestions
-            if len(self.selected_files) > 5:
-                suggestions.append("📊 Many files changed:")
-                suggestions.append("• 'This is a large change, let's break it down'")
-                suggestions.append("• 'Please test thoroughly before proceeding'")
-                suggestions.append("")
+        if has_js:
+            buf.write(
+                "📜 JavaScript/TypeScript files detected:\n"
+                "• 'Run linter and fix any issues'\n"
+                "• 'Check for proper error handling'\n"
+                "• 'Ensure proper TypeScript types'\n\n"
+            )
             
-            suggestions.append("💡 General suggestions:")
-            suggestions.append("• 'Continue - everything looks good'")
-            suggestions.append("• 'Let's discuss - I have questions'")
-            suggestions.append("• 'Fix issues - there are problems to address'")
+        if has_config:
+            buf.write(
+                "⚙️ Config files detected:\n"
+                "• 'Validate configuration syntax'\n"
+                "• 'Check if all required fields are present'\n\n"
+            )
             
-        self.feedback_text.setPlainText('\n'.join(suggestions))
+        # File count based suggestions
+        if len(self.selected_files) > 5:
+            buf.write(
+                "📊 Many files changed:\n"
+                "• 'This is a large change, let's break it down'\n"
+                "• 'Please test thoroughly before proceeding'\n\n"
+            )
+        
+        buf.write(
+            "💡 General suggestions:\n"
+            "• 'Continue - everything looks good'\n"
+            "• 'Let's discuss - I have questions'\n"
+            "• 'Fix issues - there are problems to address'"
+        )
+        self.feedback_text.setPlainText(buf.getvalue())
 
     def _setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts for better productivity"""
         # Ctrl+Enter: Submit feedback (already handled in FeedbackTextEdit)
         
         # Ctrl+1-6: Quick actions
-        shortcuts_actions = [
-            ("Ctrl+1", lambda: self._set_quick_feedback("Looks good, continue with the implementation.")),
-            ("Ctrl+2", lambda: self._set_quick_feedback("I have some questions about this approach.")),
-            ("Ctrl+3", lambda: self._set_quick_feedback("There are some issues that need to be addressed.")),
-            ("Ctrl+4", lambda: self._set_quick_feedback("Please add tests for these changes.")),
-            ("Ctrl+5", lambda: self._set_quick_feedback("Perfect! These changes look great.")),
-            ("Ctrl+6", lambda: self._set_quick_feedback("Stop here, I want to review manually."))
-        ]
-        
-        for shortcut_key, action in shortcuts_actions:
+        for shortcut_key, feedback in self._QUICK_FEEDBACK:
             shortcut = QShortcut(QKeySequence(shortcut_key), self)
-            shortcut.activated.connect(action)
+            shortcut.activated.connect(functools.partial(self._set_quick_feedback, feedback))
         
         # Ctrl+P: Preview files
         preview_shortcut = QShortcut(QKeySequence("Ctrl+P"), self)
@@ -972,13 +1347,15 @@ class FeedbackUI(QMainWindow):
         
         # Escape: Clear feedback text
         clear_shortcut = QShortcut(QKeySequence("Escape"), self)
-        clear_shortcut.activated.connect(lambda: self.feedback_text.clear())
+        clear_shortcut.activated.connect(self.feedback_text.clear)
 
     def _setup_auto_save(self):
         """Setup auto-save for feedback drafts"""
-        self.auto_save_timer = QTimer()
+        self.auto_save_timer = QTimer(self)
+        self.auto_save_timer.setSingleShot(True)
+        self.auto_save_timer.setInterval(1500)  # Save once typing pauses for 1.5 seconds
         self.auto_save_timer.timeout.connect(self._auto_save_draft)
-        self.auto_save_timer.start(5000)  # Auto-save every 5 seconds
+        self.feedback_text.textChanged.connect(self.auto_save_timer.start)
         
         # Load existing draft
         # self._load_draft()
@@ -987,16 +1364,13 @@ class FeedbackUI(QMainWindow):
         """Auto-save current feedback as draft"""
         if hasattr(self, 'feedback_text'):
             draft_text = self.feedback_text.toPlainText().strip()
-            if draft_text:  # Only save if there's content
-                self.settings.beginGroup(self.project_group_name)
-                self.settings.setValue("feedback_draft", draft_text)
-                self.settings.endGroup()
+            if draft_text and draft_text != self._last_draft_text:  # Only save new content
+                self._last_draft_text = draft_text
+                self._write_setting(self.project_group_name, "feedback_draft", draft_text)
 
     def _load_draft(self):
         """Load saved draft if exists"""
-        self.settings.beginGroup(self.project_group_name)
-        draft = self.settings.value("feedback_draft", "", type=str)
-        self.settings.endGroup()
+        draft = str(self._settings_cache.get("feedback_draft", ""))
         
         if draft and hasattr(self, 'feedback_text'):
             # Only load if feedback text is empty
@@ -1007,51 +1381,71 @@ class FeedbackUI(QMainWindow):
 
     def _clear_draft(self):
         """Clear saved draft"""
-        self.settings.beginGroup(self.project_group_name)
-        self.settings.remove("feedback_draft")
-        self.settings.endGroup()
+        self._settings_cache.pop("feedback_draft", None)
+        self._last_draft_text = None
+        self._settings_signals.remove.emit(self.project_group_name, "feedback_draft")
 
     def _get_selected_files_content(self):
         """Read content of selected files"""
         if not self.selected_files:
             return None
             
-        content_parts = []
-        content_parts.append("## Files Modified by User:")
-        content_parts.append("")
-        
-        for file_path in sorted(self.selected_files):
-            full_path = os.path.join(self.project_directory, file_path)
-            try:
-                if os.path.exists(full_path):
-                    with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    content_parts.append(f"### {file_path}")
-                    content_parts.append("```")
-                    content_parts.append(content)
-                    content_parts.append("```")
-                    content_parts.append("")
-                else:
-                    content_parts.append(f"### {file_path} (file not found)")
-                    content_parts.append("")
-            except Exception as e:
-                content_parts.append(f"### {file_path} (error reading: {str(e)})")
-                content_parts.append("")
+        buf = io.StringIO()
+        buf.write("## Files Modified by User:\n")
+        total = 0
+
+        file_paths = sorted(self.selected_files)
+        full_paths = [self._full_path(file_path) for file_path in file_paths]
+        # Reads release the GIL, so many selected files are read in parallel
+        with ThreadPoolExecutor(max_workers=min(8, len(full_paths))) as executor:
+            results = list(executor.map(self._read_file, full_paths))
+
+        for file_path, (content, error) in zip(file_paths, results):
+            if error is not None:
+                buf.write(f"\n### {file_path} (error reading: {str(error)})\n")
+            elif content is None:
+                buf.write(f"\n### {file_path} (file not found)\n")
+            else:
+                truncated = len(content) > MAX_PER_FILE
+                if truncated:
+                    content = content[:MAX_PER_FILE]
+                total += len(content)
+                if total > MAX_TOTAL:
+                    buf.write("\n... (remaining files omitted, size limit reached)\n")
+                    break
+                buf.write(f"\n### {file_path}\n```\n")
+                buf.write(content)
+                buf.write("\n... (truncated)\n```\n" if truncated else "\n```\n")
         
-        return "\n".join(content_parts)
+        return buf.getvalue()
+
+    def _full_path(self, file_path: str) -> str:
+        """Resolve a path from modified_files against the project directory"""
+        if os.path.isabs(file_path):
+            return file_path
+        return self._project_dir_prefix + file_path
+
+    @staticmethod
+    def _read_file(full_path: str):
+        """Return (content, error); content is None if the file does not exist"""
+        try:
+            with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
+                # One character past the limit tells the caller the file was truncated
+                return f.read(MAX_PER_FILE + 1), None
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            return None, e
 
     def _toggle_command_section(self):
         is_visible = self.command_group.isVisible()
+        if not is_visible:
+            self._ensure_command_section()
         self.command_group.setVisible(not is_visible)
         if not is_visible:
             self.toggle_command_button.setText("Hide Command Section")
         else:
             self.toggle_command_button.setText("Show Command Section")
-        
-        # Immediately save the visibility state for this project
-        self.settings.beginGroup(self.project_group_name)
-        self.settings.setValue("commandSectionVisible", self.command_group.isVisible())
-        self.settings.endGroup()
 
         # Adjust window height only
         new_height = self.centralWidget().sizeHint().height()
@@ -1069,11 +1463,29 @@ class FeedbackUI(QMainWindow):
 
     def _append_log(self, text: str):
         self.log_buffer.append(text)
-        self.log_text.append(text.rstrip())
+        self._pending_log_chunks.append(text)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if not self._pending_log_chunks:
+            return
+        text = "".join(self._pending_log_chunks)
+        self._pending_log_chunks.clear()
+        self.log_text.appendPlainText(text.rstrip())
         cursor = self.log_text.textCursor()
         cursor.movePosition(QTextCursor.End)
         self.log_text.setTextCursor(cursor)
 
+    def _kill_process(self):
+        kill_tree(self.process, self._job)
+        self._job = None
+
+    def _close_job(self):
+        if self._job is not None:
+            close_kill_job(self._job)
+            self._job = None
+
     def _check_process_status(self):
         if self.process and self.process.poll() is not None:
             # Process has terminated
@@ -1081,12 +1493,14 @@ class FeedbackUI(QMainWindow):
             self._append_log(f"\nProcess exited with code {exit_code}\n")
             self.run_button.setText("&Run")
             self.process = None
+            self._close_job()
             self.activateWindow()
             self.feedback_text.setFocus()
 
     def _run_command(self):
+        self._ensure_command_section()
         if self.process:
-            kill_tree(self.process)
+            self._kill_process()
             self.process = None
             self.run_button.setText("&Run")
             return
@@ -1108,18 +1522,34 @@ class FeedbackUI(QMainWindow):
                 shell=True,
                 cwd=self.project_directory,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 env=get_user_environment(),
-                text=True,
-                bufsize=1,
-                encoding="utf-8",
-                errors="ignore",
+                bufsize=0,
                 close_fds=True,
+                start_new_session=not _IS_WIN,
             )
+            self._close_job()
+            self._job = create_kill_job(self.process)
 
             def read_output(pipe):
-                for line in iter(pipe.readline, ""):
-                    self.log_signals.append_log.emit(line)
+                # stderr is merged into stdout, so one thread drains both.
+                # Each read takes whatever is available (up to 64 KB) and is emitted as one batch of whole lines.
+                # The thread holds the pipe object itself, so its fd stays open until EOF
+                # even after self.process is cleared and the Popen is collected.
+                decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(errors="ignore"), translate=True)
+                pending = ""
+                with pipe:
+                    while True:
+                        data = pipe.read(65536)  # Unbuffered pipe: returns whatever one read(2) yields
+                        pending += decoder.decode(data, final=not data)
+                        if not data:
+                            if pending:
+                                self.log_signals.append_log.emit(pending)
+                            break
+                        cut = pending.rfind("\n") + 1
+                        if cut:
+                            self.log_signals.append_log.emit(pending[:cut])
+                            pending = pending[cut:]
 
             threading.Thread(
                 target=read_output,
@@ -1127,12 +1557,6 @@ class FeedbackUI(QMainWindow):
                 daemon=True
             ).start()
 
-            threading.Thread(
-                target=read_output,
-                args=(self.process.stderr,),
-                daemon=True
-            ).start()
-
             # Start process status checking
             self.status_timer = QTimer()
             self.status_timer.timeout.connect(self._check_process_status)
@@ -1181,30 +1605,46 @@ class FeedbackUI(QMainWindow):
 
     def clear_logs(self):
         self.log_buffer = []
+        self._log_flush_timer.stop()
+        self._pending_log_chunks.clear()
         self.log_text.clear()
 
+    def _write_setting(self, group: str, key: str, value):
+        self._write_settings(group, {key: value})
+
+    def _write_settings(self, group: str, values: dict):
+        if group == self.project_group_name:
+            self._settings_cache.update(values)
+        self._settings_signals.write.emit(group, values)
+
     def _save_config(self):
         # Save run_command and execute_automatically to QSettings under project group
-        self.settings.beginGroup(self.project_group_name)
-        self.settings.setValue("run_command", self.config["run_command"])
-        self.settings.setValue("execute_automatically", self.config["execute_automatically"])
-        self.settings.endGroup()
+        self._write_settings(self.project_group_name, {
+            "run_command": self.config["run_command"],
+            "execute_automatically": self.config["execute_automatically"],
+        })
         self._append_log("Configuration saved for this project.\n")
 
     def closeEvent(self, event):
         # Save general UI settings for the main window (geometry, state)
-        self.settings.beginGroup("MainWindow_General")
-        self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("windowState", self.saveState())
-        self.settings.endGroup()
-
-        # Save project-specific command section visibility (this is now slightly redundant due to immediate save in toggle, but harmless)
-        self.settings.beginGroup(self.project_group_name)
-        self.settings.setValue("commandSectionVisible", self.command_group.isVisible())
-        self.settings.endGroup()
+        self._write_settings("MainWindow_General", {
+            "geometry": self.saveGeometry(),
+            "windowState": self.saveState(),
+        })
+
+        # Save project-specific command section visibility along with the rule states
+        command_visible = self.command_group.isVisible()
+        if command_visible != self._last_command_visible:
+            self._last_command_visible = command_visible
+            self._settings_cache["commandSectionVisible"] = command_visible
+            self._dirty_settings.add("commandSectionVisible")
+        self._flush_dirty_settings()
+
+        # The only explicit flush; QSettings syncs on its own between writes
+        flush_settings_writer()
 
         if self.process:
-            kill_tree(self.process)
+            self._kill_process()
         super().closeEvent(event)
 
     def run(self) -> FeedbackResult:
@@ -1212,7 +1652,7 @@ class FeedbackUI(QMainWindow):
         QApplication.instance().exec()
 
         if self.process:
-            kill_tree(self.process)
+            self._kill_process()
 
         if not self.feedback_result:
             return FeedbackResult(
@@ -1224,17 +1664,93 @@ class FeedbackUI(QMainWindow):
 
         return self.feedback_result
 
+_settings: Optional[QSettings] = None
+
+def get_settings() -> QSettings:
+    """Return the process-wide QSettings, opening the backend only once"""
+    global _settings
+    if _settings is None:
+        _settings = open_settings()
+    return _settings
+
+def open_settings() -> QSettings:
+    return QSettings("InteractiveFeedbackMCP", "InteractiveFeedbackMCP")
+
+_settings_thread: Optional[QThread] = None
+_settings_writer: Optional[SettingsWriter] = None
+_settings_signals: Optional[SettingsSignals] = None
+
+def get_settings_writer() -> SettingsSignals:
+    """Return the signals feeding the process-wide settings writer thread, starting it on first use.
+
+    The thread outlives every window, so a window that is never closed (or fails
+    half way through __init__) cannot destroy it while it is running.
+    """
+    global _settings_thread, _settings_writer, _settings_signals
+    if _settings_signals is None:
+        _settings_thread = QThread()
+        _settings_writer = SettingsWriter()
+        _settings_writer.moveToThread(_settings_thread)
+        _settings_signals = SettingsSignals()
+        _settings_signals.write.connect(_settings_writer.write)
+        _settings_signals.remove.connect(_settings_writer.remove)
+        # Blocking so a flush returns only after every queued write is on disk
+        _settings_signals.flush.connect(_settings_writer.flush, Qt.BlockingQueuedConnection)
+        _settings_thread.start()
+        atexit.register(stop_settings_writer)
+    return _settings_signals
+
+def flush_settings_writer() -> None:
+    # A blocking emit to a stopped thread would never return
+    if _settings_thread is not None and _settings_thread.isRunning():
+        _settings_signals.flush.emit()
+
+def stop_settings_writer() -> None:
+    """Flush pending writes and stop the writer thread before the interpreter exits"""
+    if _settings_thread is not None and _settings_thread.isRunning():
+        flush_settings_writer()
+        _settings_thread.quit()
+        _settings_thread.wait()
+
+def read_settings_group(settings: QSettings, group: str) -> dict:
+    """Read every key of a settings group in one pass"""
+    settings.beginGroup(group)
+    try:
+        return {key: settings.value(key) for key in settings.childKeys()}
+    finally:
+        settings.endGroup()
+
+def settings_bool(value, default: bool) -> bool:
+    # Untyped QSettings reads return "true"/"false" strings on INI and registry backends
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return value.lower() in ("true", "1")
+    return bool(value)
+
+@functools.lru_cache(maxsize=64)
 def get_project_settings_group(project_dir: str) -> str:
     # Create a safe, unique group name from the project directory path
-    # Using only the last component + hash of full path to keep it somewhat readable but unique
+    # Using only the last component + hash of full path to keep it somewhat readable but unique.
+    # The hash must stay md5: changing it would orphan every project's saved settings.
     basename = os.path.basename(os.path.normpath(project_dir))
     full_hash = hashlib.md5(project_dir.encode('utf-8')).hexdigest()[:8]
     return f"{basename}_{full_hash}"
 
+_app: Optional[QApplication] = None
+
+def get_app() -> QApplication:
+    """Return the QApplication, applying palette, style and stylesheet only the first time"""
+    global _app
+    if _app is None:
+        _app = QApplication.instance() or QApplication()
+        _app.setPalette(get_dark_mode_palette(_app))
+        _app.setStyle("Fusion")
+        _app.setStyleSheet(APP_QSS)
+    return _app
+
 def feedback_ui(project_directory: str, prompt: str, output_file: Optional[str] = None, modified_files: Optional[List[str]] = None) -> Optional[FeedbackResult]:
-    app = QApplication.instance() or QApplication()
-    app.setPalette(get_dark_mode_palette(app))
-    app.setStyle("Fusion")
+    get_app()
     ui = FeedbackUI(project_directory, prompt, modified_files)
     result = ui.run()
 
@@ -1248,19 +1764,76 @@ def feedback_ui(project_directory: str, prompt: str, output_file: Optional[str]
 
     return result
 
-if __name__ == "__main__":
+def run_request(request: dict) -> FeedbackResult:
+    """Show the feedback UI for a single batch request"""
+    return feedback_ui(
+        request.get("project_directory", os.getcwd()),
+        request.get("prompt", "I implemented the changes you requested."),
+        modified_files=request.get("modified_files")
+    )
+
+def run_batch(requests, output) -> None:
+    """Serve newline-delimited JSON feedback requests, writing one JSON result per line"""
+    for line in requests:
+        line = line.strip()
+        if not line:
+            continue
+        result = run_request(json.loads(line))
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+def claim_stdout():
+    """Return a private handle on the real stdout and point fd 1 at devnull.
+
+    Used when stdout carries results, so stray prints from the UI or Qt cannot corrupt them.
+    """
+    sys.stdout.flush()
+    output = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    return output
+
+def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Run the feedback UI")
     parser.add_argument("--project-directory", default=os.getcwd(), help="The project directory to run the command in")
     parser.add_argument("--prompt", default="I implemented the changes you requested.", help="The prompt to show to the user")
     parser.add_argument("--output-file", help="Path to save the feedback result as JSON")
+    parser.add_argument("--output-pipe", action="store_true", help="Write the feedback result as JSON to stdout; anything else printed to stdout is discarded")
     parser.add_argument("--modified-files", help="JSON string of modified file paths", default=None)
-    args = parser.parse_args()
+    parser.add_argument("--batch-stdin", action="store_true", help="Read newline-delimited JSON requests from stdin and write one JSON result per line to stdout")
+    parser.add_argument("--batch-config", help="Path to a JSON list of requests to run in a single UI process; results go to --output-file as a JSON list")
+    args = parser.parse_args(argv)
+
+    if args.batch_stdin:
+        with claim_stdout() as output:
+            run_batch(sys.stdin, output)
+        return 0
+
+    if args.batch_config:
+        if not args.output_file:
+            parser.error("--batch-config requires --output-file")
+        with open(args.batch_config, "r", encoding="utf-8") as f:
+            requests = json.load(f)
+        results = [run_request(request) for request in requests]
+        with open(args.output_file, "w") as f:
+            json.dump(results, f)
+        return 0
 
     modified_files = json.loads(args.modified_files) if args.modified_files else None
+
+    if args.output_pipe:
+        with claim_stdout() as output:
+            json.dump(feedback_ui(args.project_directory, args.prompt, None, modified_files), output)
+        return 0
+
     result = feedback_ui(args.project_directory, args.prompt, args.output_file, modified_files)
     if result:
         print(f"\nLogs collected: \n{result['command_logs']}")
         print(f"\nFeedback received:\n{result['interactive_feedback']}")
         if result['selected_files']:
             print(f"\nSelected files: {', '.join(result['selected_files'])}")
-    sys.exit(0)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,11 @@
 import os
 import sys
 import json
-import tempfile
+import time
+import functools
+import threading
 import subprocess
-import glob
+import multiprocessing
 from pathlib import Path
 
 from typing import Annotated, Dict, Optional, List
@@ -19,19 +21,41 @@ mcp = FastMCP("Interactive Feedback MCP", log_level="ERROR")
 
 def find_latest_modified_md_file(project_directory: str) -> Optional[str]:
     """Find the latest modified .md file in the project directory"""
+    # Calls within the same tenth of a second reuse the previous scan
+    return _find_latest_modified_md_file(project_directory, round(time.time(), 1))
+
+@functools.lru_cache(maxsize=8)
+def _find_latest_modified_md_file(project_directory: str, _time_bucket: float) -> Optional[str]:
     try:
-        # Find all .md files in project directory (including subdirectories)
-        md_pattern = os.path.join(project_directory, "**", "*.md")
-        md_files = glob.glob(md_pattern, recursive=True)
-        
-        if not md_files:
+        # Walk the project directory (including subdirectories) once, keeping only the newest .md file.
+        # Like the previous glob("**/*.md"), hidden files and directories are skipped.
+        latest_mtime = None
+        latest_file = None
+        stack = [project_directory]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif os.path.normcase(entry.name).endswith(".md") and entry.is_file():
+                            mtime = entry.stat().st_mtime
+                            if latest_mtime is None or mtime > latest_mtime:
+                                latest_mtime = mtime
+                                latest_file = entry.path
+                    except OSError:
+                        continue
+
+        if latest_file is None:
             return None
         
-        # Sort by modification time, newest first
-        md_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-        
         # Return path relative to project directory
-        latest_file = md_files[0]
         return os.path.relpath(latest_file, project_directory)
     except Exception:
         return None
@@ -48,54 +72,90 @@ def enhance_modified_files(project_directory: str, modified_files: Optional[List
     
     return enhanced_files
 
+# Long-lived UI process (process, connection), started on first use and reused across calls
+_ui_worker = None
+_ui_worker_lock = threading.Lock()
+
+def _feedback_worker(conn) -> None:
+    """Show one feedback window per request received on conn, reusing the QApplication"""
+    # stdout is the MCP stdio channel, so Qt and the UI must not write to it
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    from feedback_ui import feedback_ui
+    while True:
+        try:
+            project_directory, summary, modified_files = conn.recv()
+        except EOFError:
+            break
+        conn.send(feedback_ui(project_directory, summary, modified_files=modified_files))
+
+def _run_in_worker(project_directory: str, summary: str, modified_files: List[str]) -> dict[str, str]:
+    global _ui_worker
+    if _ui_worker is None or not _ui_worker[0].is_alive():
+        # spawn rather than fork: the server has threads and an event loop running
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(target=_feedback_worker, args=(child_conn,), daemon=True)
+        process.start()
+        child_conn.close()
+        _ui_worker = (process, parent_conn)
+
+    process, conn = _ui_worker
+    try:
+        conn.send((project_directory, summary, modified_files))
+        return conn.recv()
+    except Exception:
+        _ui_worker = None
+        process.kill()
+        raise
+
 def launch_feedback_ui(project_directory: str, summary: str, modified_files: Optional[List[str]] = None) -> dict[str, str]:
     enhanced_modified_files = enhance_modified_files(project_directory, modified_files)
+
+    with _ui_worker_lock:
+        try:
+            return _run_in_worker(project_directory, summary, enhanced_modified_files)
+        except Exception as e:
+            print(f"Feedback UI worker unavailable ({e}), starting a separate process", file=sys.stderr)
+            return launch_feedback_ui_process(project_directory, summary, enhanced_modified_files)
+
+def launch_feedback_ui_process(project_directory: str, summary: str, enhanced_modified_files: List[str]) -> dict[str, str]:
+    # Get the path to feedback_ui.py relative to this script
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    feedback_ui_path = os.path.join(script_dir, "feedback_ui.py")
+
+    # Run feedback_ui.py as a separate process
+    # NOTE: There appears to be a bug in uv, so we need
+    # to pass a bunch of special flags to make this work
+    args = [
+        sys.executable,
+        "-u",
+        feedback_ui_path,
+        "--project-directory", project_directory,
+        "--prompt", summary,
+        "--output-pipe"
+    ]
     
-    # Create a temporary file for the feedback result
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-        output_file = tmp.name
+    # Add enhanced modified files
+    if enhanced_modified_files:
+        args.extend(["--modified-files", json.dumps(enhanced_modified_files)])
 
-    try:
-        # Get the path to feedback_ui.py relative to this script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        feedback_ui_path = os.path.join(script_dir, "feedback_ui.py")
-
-        # Run feedback_ui.py as a separate process
-        # NOTE: There appears to be a bug in uv, so we need
-        # to pass a bunch of special flags to make this work
-        args = [
-            sys.executable,
-            "-u",
-            feedback_ui_path,
-            "--project-directory", project_directory,
-            "--prompt", summary,
-            "--output-file", output_file
-        ]
-        
-        # Add enhanced modified files
-        if enhanced_modified_files:
-            args.extend(["--modified-files", json.dumps(enhanced_modified_files)])
-        result = subprocess.run(
-            args,
-            check=False,
-            shell=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            stdin=subprocess.DEVNULL,
-            close_fds=True
-        )
-        if result.returncode != 0:
-            raise Exception(f"Failed to launch feedback UI: {result.returncode}")
-
-        # Read the result from the temporary file
-        with open(output_file, 'r') as f:
-            result = json.load(f)
-        os.unlink(output_file)
-        return result
-    except Exception as e:
-        if os.path.exists(output_file):
-            os.unlink(output_file)
-        raise e
+    # The result comes back over the stdout pipe rather than through a temporary file
+    result = subprocess.run(
+        args,
+        check=False,
+        shell=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        stdin=subprocess.DEVNULL,
+        close_fds=True
+    )
+    if result.returncode != 0:
+        raise Exception(f"Failed to launch feedback UI: {result.returncode}")
+
+    return json.loads(result.stdout)
 
 def first_line(text: str) -> str:
     return text.split("\n")[0].strip()